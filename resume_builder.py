@@ -1,34 +1,78 @@
 #!/usr/bin/env python3
 
+import argparse
+import hashlib
+import json
 import os
+import shutil
 import subprocess
+import sys
+import tempfile
 import re
-from jinja2 import Environment, FileSystemLoader
 
 # A dictionary to hold all the resume data
 resume_data = {}
 
+# Compiled PDFs are cached here, keyed by a hash of the rendered LaTeX
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'resume-builder')
+
+# How many files of each kind the cache keeps; formats are several MB each
+_CACHE_LIMITS = {'.pdf': 20, '.aux': 20, '.out': 20, '.fmt': 3, '.failed': 20}
+# LaTeX files reused by the next build of a document with the same preamble
+_CARRIED_EXTENSIONS = ('.aux', '.out')
+
+# The compiled template, loaded once per process by _get_template()
+_TEMPLATE = None
+
+# LaTeX special characters and their escaped forms. Every entry is a
+# single character, so a translation table escapes a string in one pass.
+_LATEX_TRANSLATE = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+})
+# \href reads its URL almost verbatim; only these need escaping there.
+_URL_TRANSLATE = str.maketrans({
+    '\\': r'\\',
+    '%': r'\%',
+    '#': r'\#',
+})
+# Matches any character that needs escaping; most fields contain none.
+# Written out by hand: it must list exactly the keys of _LATEX_TRANSLATE.
+_LATEX_SPECIAL_RE = re.compile(r'[\\&%$#_{}~^]')
+# Separator for comma-separated input, swallowing surrounding whitespace
+_CSV_RE = re.compile(r'\s*,\s*')
+# Commands whose output depends on a previous pdflatex run.
+_CROSS_REF_RE = re.compile(r'\\(ref|pageref|cite|tableofcontents|listoffigures)\b')
+# hyperref writes PDF bookmarks for sections to the .out file, which is
+# only read back on the next run.
+_HYPERREF_RE = re.compile(r'\\usepackage(\[[^\]]*\])?\{hyperref\}')
+_SECTION_RE = re.compile(r'\\(sub)*section\b')
+
 def escape_latex_special_chars(text):
     """
     Escapes special LaTeX characters in a given string.
     """
     if not isinstance(text, str):
         return text
-    # Order matters here. '\' must be escaped first.
-    conv = {
-        '\\': r'\\',
-        '&': r'\&',
-        '%': r'\%',
-        '$': r'\$',
-        '#': r'\#',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-        '~': r'\textasciitilde{}',
-        '^': r'\textasciicircum{}',
-    }
-    regex = re.compile('|'.join(re.escape(str(key)) for key in sorted(conv.keys(), key=lambda item: - len(item))))
-    return regex.sub(lambda match: conv[match.group()], text)
+    if not _LATEX_SPECIAL_RE.search(text):
+        return text
+    return text.translate(_LATEX_TRANSLATE)
+
+def escape_latex_url(url):
+    """
+    Escapes a URL for use as the target of \\href.
+    """
+    if not isinstance(url, str):
+        return url
+    return url.translate(_URL_TRANSLATE)
 
 def get_user_input(prompt):
     """Gets a single line of input from the user."""
@@ -60,14 +104,8 @@ def collect_summary():
     """Collects the professional summary."""
     print("\n--- Professional Summary ---")
     print("Enter your professional summary (a few sentences). Press Ctrl+D (Unix) or Ctrl+Z (Windows) then Enter when done.")
-    summary_lines = []
-    try:
-        while True:
-            line = input()
-            summary_lines.append(line)
-    except EOFError:
-        pass
-    resume_data['summary'] = ' '.join(summary_lines)
+    # Read everything up to EOF at once and collapse line breaks/extra whitespace
+    resume_data['summary'] = ' '.join(sys.stdin.read().split())
 
 def collect_technical_skills():
     """Collects technical skills, categorized."""
@@ -80,7 +118,7 @@ def collect_technical_skills():
     for category in categories:
         user_input = get_user_input(f"{category} (comma-separated)")
         if user_input:
-            skills[category] = [skill.strip() for skill in user_input.split(',')]
+            skills[category] = _CSV_RE.split(user_input.strip())
     resume_data['technical_skills'] = skills
 
 def collect_experience():
@@ -177,42 +215,261 @@ def collect_publications():
         publications.append(entry)
     resume_data['publications'] = publications
 
-def sanitize_data(data):
-    """Recursively traverses the data and escapes LaTeX special characters."""
-    if isinstance(data, dict):
-        return {k: sanitize_data(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return [sanitize_data(i) for i in data]
-    if isinstance(data, str):
-        return escape_latex_special_chars(data)
-    return data
-
-def main():
+def _needs_two_passes(tex):
+    """Returns True if the LaTeX needs a second pdflatex run to come out right."""
+    if _CROSS_REF_RE.search(tex):
+        return True
+    return bool(_HYPERREF_RE.search(tex) and _SECTION_RE.search(tex))
+
+def _ensure_format(tex_filename, preamble_hash):
+    """
+    Precompiles the preamble up to \\endofdump into a pdflatex format file,
+    cached under the preamble's hash. Returns the format's path, or None if
+    no usable format is available.
+
+    A failed build is recorded in a marker file next to the format, so the
+    same preamble doesn't retry it on every run.
+    """
+    fmt_path = os.path.join(_CACHE_DIR, f"{preamble_hash}.fmt")
+    try:
+        # Mark it recently used so _prune_cache keeps it
+        os.utime(fmt_path)
+        return fmt_path
+    except OSError:
+        pass
+    if os.path.exists(os.path.join(_CACHE_DIR, f"{preamble_hash}.failed")):
+        return None
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+    except OSError:
+        return None
+    try:
+        subprocess.run(
+            ['pdflatex', '-ini', '-interaction=nonstopmode', '-halt-on-error', f'-jobname={preamble_hash}',
+             f'-output-directory={_CACHE_DIR}', '&pdflatex', 'mylatexformat.ltx', tex_filename],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        # mylatexformat is missing or the preamble can't be dumped;
+        # fall back to loading the preamble on every run.
+        _mark_format_failed(preamble_hash)
+        return None
+    finally:
+        try:
+            os.unlink(os.path.join(_CACHE_DIR, f"{preamble_hash}.log"))
+        except OSError:
+            pass
+    return fmt_path
+
+def _mark_format_failed(preamble_hash):
+    """Drops the cached format for a preamble and stops it from being rebuilt."""
+    try:
+        os.unlink(os.path.join(_CACHE_DIR, f"{preamble_hash}.fmt"))
+    except OSError:
+        pass
+    try:
+        with open(os.path.join(_CACHE_DIR, f"{preamble_hash}.failed"), "w", encoding="utf-8"):
+            pass
+    except OSError:
+        pass
+
+def _run_pdflatex(tex_filename, work_dir, fmt_path=None, draft=False):
+    """
+    Runs one pdflatex pass, writing output to work_dir. A draft pass only
+    writes the auxiliary files. Raises CalledProcessError on failure.
+    """
+    args = ['pdflatex', '-interaction=nonstopmode', f'-output-directory={work_dir}']
+    if draft:
+        args += ['-draftmode', '-halt-on-error']
+    if fmt_path:
+        args.append(f'-fmt={fmt_path}')
+    args.append(tex_filename)
+    # Everything pdflatex prints also goes to its .log, which is read on failure
+    subprocess.run(
+        args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True
+    )
+
+def _log_excerpt(log_filename, max_lines=40):
+    """
+    Returns the part of a LaTeX log worth showing: the lines from the first
+    error ('! ...') on, or the end of the log if there is no such line.
+    """
+    try:
+        with open(log_filename, encoding='utf-8', errors='ignore') as fh:
+            lines = fh.read().splitlines()
+    except FileNotFoundError:
+        return None
+    for i, line in enumerate(lines):
+        if line.startswith('!'):
+            return '\n'.join(lines[i:i + max_lines])
+    return '\n'.join(lines[-max_lines:])
+
+def _read_carried_files(work_dir, jobname):
+    """Returns the contents of the .aux/.out files in work_dir, keyed by extension."""
+    contents = {}
+    for ext in _CARRIED_EXTENSIONS:
+        try:
+            with open(os.path.join(work_dir, jobname + ext), 'rb') as fh:
+                contents[ext] = fh.read()
+        except FileNotFoundError:
+            contents[ext] = None
+    return contents
+
+def _compile(tex_filename, work_dir, needs_two_passes, fmt_path=None):
+    """
+    Compiles tex_filename to a PDF in work_dir.
+
+    If .aux/.out files from an earlier build were primed into work_dir, the
+    first pass is a full one, and a second pass only runs if the first one
+    changed them. Otherwise, when a second pass is needed, the first runs in
+    draft mode just to write the .aux/.out files.
+    """
+    jobname = os.path.splitext(os.path.basename(tex_filename))[0]
+    primed = _read_carried_files(work_dir, jobname)
+    is_primed = any(content is not None for content in primed.values())
+    if needs_two_passes and not is_primed:
+        try:
+            _run_pdflatex(tex_filename, work_dir, fmt_path, draft=True)
+        except subprocess.CalledProcessError:
+            # Let the full pass report the error; in nonstopmode it still
+            # writes whatever PDF it can
+            pass
+    _run_pdflatex(tex_filename, work_dir, fmt_path)
+    if needs_two_passes and is_primed and _read_carried_files(work_dir, jobname) != primed:
+        _run_pdflatex(tex_filename, work_dir, fmt_path)
+
+def _prune_cache(limits=None):
+    """Deletes all but the newest cached files of each kind, per _CACHE_LIMITS."""
+    limits = limits or _CACHE_LIMITS
+    by_ext = {}
+    with os.scandir(_CACHE_DIR) as entries:
+        for entry in entries:
+            ext = os.path.splitext(entry.name)[1]
+            if entry.is_file() and ext in limits:
+                by_ext.setdefault(ext, []).append((entry.stat().st_mtime, entry.path))
+    for ext, files in by_ext.items():
+        files.sort(reverse=True)
+        for _, path in files[limits[ext]:]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+def _get_template():
+    """Returns the compiled template.tex, building it on first use."""
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        # Imported here so startup and data collection don't pay for Jinja2
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+        bytecode_dir = os.path.join(_CACHE_DIR, 'jinja')
+        try:
+            os.makedirs(bytecode_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+        except OSError:
+            # An unwritable cache only costs a recompile of the template
+            bytecode_cache = None
+        # LaTeX-safe delimiters, so braces and '#' in the template are left alone
+        env = Environment(
+            block_start_string='((*',
+            block_end_string='*))',
+            variable_start_string='(((',
+            variable_end_string=')))',
+            comment_start_string='((#',
+            comment_end_string='#))',
+            loader=FileSystemLoader('.'),
+            autoescape=False,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache,
+        )
+        env.filters['l'] = escape_latex_special_chars
+        env.filters['u'] = escape_latex_url
+        _TEMPLATE = env.get_template('template.tex')
+    return _TEMPLATE
+
+def _blank_nones(value):
+    """Replaces None (an empty YAML value) with '' throughout value."""
+    if value is None:
+        return ''
+    if isinstance(value, dict):
+        return {key: _blank_nones(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_blank_nones(item) for item in value]
+    return value
+
+def load_resume_file(path):
+    """
+    Loads resume data from a YAML or JSON file into resume_data.
+    Returns an error message, or None on success.
+    """
+    # Imported here so the interactive path doesn't pay for PyYAML
+    import yaml
+
+    try:
+        with open(path, encoding="utf-8") as fh:
+            if path.lower().endswith('.json'):
+                # PyYAML rejects valid JSON that YAML forbids, e.g. tab indentation
+                data = json.load(fh)
+            else:
+                data = yaml.safe_load(fh)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        return f"Could not read '{path}': {e}"
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        return f"'{path}' must contain a mapping of resume fields at the top level."
+
+    # The template loops over these sections, so they must exist with the right shape
+    sections = {'technical_skills': dict, 'experience': list, 'internships': list,
+                'education': list, 'projects': list, 'publications': list}
+    for section, kind in sections.items():
+        if data.get(section) is None:
+            data[section] = kind()
+        elif not isinstance(data[section], kind):
+            return f"'{section}' in '{path}' must be a {'mapping' if kind is dict else 'list'}."
+        if kind is list and not all(isinstance(entry, dict) for entry in data[section]):
+            return f"Every entry of '{section}' in '{path}' must be a mapping."
+    resume_data.update(_blank_nones(data))
+    return None
+
+def main(argv=None):
     """Main function to run the resume builder."""
+    parser = argparse.ArgumentParser(description="Build a LaTeX/PDF resume.")
+    parser.add_argument('--from', dest='from_file', metavar='FILE',
+                        help="read all resume data from a YAML or JSON file instead of prompting")
+    args = parser.parse_args(argv)
+
     print("Welcome to the Python Resume Builder! 📝")
-    print("Please fill in the details for your resume.")
-
-    # 1. Collect all data from the user
-    collect_personal_info()
-    collect_summary()
-    collect_technical_skills()
-    collect_experience()
-    collect_internships()
-    collect_education()
-    collect_projects()
-    collect_publications()
-    
-    # 2. Sanitize data for LaTeX
-    sanitized_resume_data = sanitize_data(resume_data)
 
-    # 3. Set up Jinja2 environment
-    env = Environment(loader=FileSystemLoader('.'), autoescape=False)
-    template = env.get_template('template.tex')
+    # 1. Collect all data from the file or the user
+    if args.from_file:
+        error = load_resume_file(args.from_file)
+        if error:
+            print(f"\n❌ Error: {error}")
+            return
+    else:
+        print("Please fill in the details for your resume.")
+        collect_personal_info()
+        collect_summary()
+        collect_technical_skills()
+        collect_experience()
+        collect_internships()
+        collect_education()
+        collect_projects()
+        collect_publications()
+    
+    # 2. Load the compiled Jinja2 template
+    template = _get_template()
     
-    # 4. Render the template with user data
-    output_from_template = template.render(sanitized_resume_data)
+    # 3. Render the template with user data, escaping LaTeX special characters as it goes
+    output_from_template = template.render(resume_data)
     
-    # 5. Write the rendered LaTeX to a .tex file
+    # 4. Write the rendered LaTeX to a .tex file
     output_filename_base = "resume"
     tex_filename = f"{output_filename_base}.tex"
     with open(tex_filename, "w", encoding="utf-8") as fh:
@@ -220,34 +477,100 @@ def main():
         
     print(f"\n✅ '{tex_filename}' has been created.")
     
-    # 6. Compile the .tex file to a PDF using pdflatex
-    print("Compiling to PDF... this may take a moment. ⏳")
+    # 5. Reuse the cached PDF if this exact LaTeX was compiled before
+    pdf_filename = f"{output_filename_base}.pdf"
+    content_hash = hashlib.blake2b(output_from_template.encode('utf-8')).hexdigest()
+    cached_pdf = os.path.join(_CACHE_DIR, f"{content_hash}.pdf")
     try:
-        # We run it twice to ensure all references (if any) are correctly generated.
-        for i in range(2):
-            process = subprocess.run(
-                ['pdflatex', '-interaction=nonstopmode', tex_filename],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True
-            )
-        print(f"✅ Success! Your resume has been generated as '{output_filename_base}.pdf'. 🎉")
-    except FileNotFoundError:
-        print("\n❌ Error: 'pdflatex' command not found.")
-        print("Please ensure you have a LaTeX distribution (like MiKTeX, TeX Live, or MacTeX) installed and in your system's PATH.")
-        return
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Error during PDF compilation. LaTeX returned a non-zero exit code: {e.returncode}")
-        print("Please check the 'resume.log' file for detailed LaTeX errors.")
-        print("\n--- LaTeX Output ---")
-        print(e.stdout.decode('utf-8', errors='ignore'))
+        shutil.copyfile(cached_pdf, pdf_filename)
+        # Mark it recently used so _prune_cache keeps it
+        os.utime(cached_pdf)
+        print(f"✅ Unchanged since the last build. Your resume is in '{pdf_filename}'. 🎉")
         return
-    finally:
-        # 7. Clean up auxiliary files
-        extensions_to_clean = ['.aux', '.log', '.out']
-        for ext in extensions_to_clean:
-            if os.path.exists(output_filename_base + ext):
-                os.remove(output_filename_base + ext)
+    except OSError:
+        # Not cached, or the cache can't be read
+        pass
+    # Formats and .aux/.out files are shared by documents with the same preamble
+    preamble = output_from_template.split('\\begin{document}', 1)[0]
+    preamble_hash = hashlib.blake2b(preamble.encode('utf-8')).hexdigest()
+
+    # 6. Compile the .tex file to a PDF using pdflatex
+    print("Compiling to PDF... this may take a moment. ⏳")
+    # pdflatex writes .aux/.log/.out/.pdf to a scratch directory, not the CWD
+    with tempfile.TemporaryDirectory(prefix='resume-builder-') as work_dir:
+        work_pdf = os.path.join(work_dir, pdf_filename)
+        # Start from the last compatible run's .aux/.out, so references and
+        # bookmarks are usually right after a single full pass
+        for ext in _CARRIED_EXTENSIONS:
+            try:
+                shutil.copyfile(os.path.join(_CACHE_DIR, preamble_hash + ext),
+                                os.path.join(work_dir, output_filename_base + ext))
+            except OSError:
+                pass
+        try:
+            fmt_path = _ensure_format(tex_filename, preamble_hash)
+            needs_two_passes = _needs_two_passes(output_from_template)
+            try:
+                _compile(tex_filename, work_dir, needs_two_passes, fmt_path)
+            except subprocess.CalledProcessError:
+                if not fmt_path:
+                    raise
+                # The format may be unusable, e.g. built by an older TeX engine.
+                # Retry with the full preamble; if that works, stop using formats
+                # for this preamble instead of rebuilding one on every run.
+                for ext in _CARRIED_EXTENSIONS:
+                    try:
+                        os.unlink(os.path.join(work_dir, output_filename_base + ext))
+                    except FileNotFoundError:
+                        pass
+                _compile(tex_filename, work_dir, needs_two_passes)
+                _mark_format_failed(preamble_hash)
+        except FileNotFoundError:
+            print("\n❌ Error: 'pdflatex' command not found.")
+            print("Please ensure you have a LaTeX distribution (like MiKTeX, TeX Live, or MacTeX) installed and in your system's PATH.")
+            return
+        except subprocess.CalledProcessError as e:
+            print(f"\n❌ Error during PDF compilation. LaTeX returned a non-zero exit code: {e.returncode}")
+            # Keep the log, and any PDF LaTeX managed to produce, before the
+            # scratch directory is removed
+            log_filename = f"{output_filename_base}.log"
+            work_log = os.path.join(work_dir, log_filename)
+            if os.path.exists(work_pdf):
+                shutil.move(work_pdf, pdf_filename)
+                print(f"A partial PDF was still written to '{pdf_filename}'.")
+            if os.path.exists(work_log):
+                shutil.copyfile(work_log, log_filename)
+                print(f"Please check the '{log_filename}' file for detailed LaTeX errors.")
+            excerpt = _log_excerpt(work_log)
+            if excerpt:
+                print("\n--- LaTeX Output ---")
+                print(excerpt)
+            return
+
+        if not os.path.exists(work_pdf):
+            print("\n❌ Error: pdflatex finished without producing a PDF.")
+            return
+        shutil.move(work_pdf, pdf_filename)
+        # Drop the log a previous failed build left behind
+        try:
+            os.unlink(f"{output_filename_base}.log")
+        except FileNotFoundError:
+            pass
+        print(f"✅ Success! Your resume has been generated as '{pdf_filename}'. 🎉")
+
+        # 7. Keep the PDF and .aux/.out for the next build; a cache failure isn't fatal
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            shutil.copyfile(pdf_filename, cached_pdf)
+            for ext in _CARRIED_EXTENSIONS:
+                try:
+                    shutil.copyfile(os.path.join(work_dir, output_filename_base + ext),
+                                    os.path.join(_CACHE_DIR, preamble_hash + ext))
+                except FileNotFoundError:
+                    pass
+            _prune_cache()
+        except OSError as e:
+            print(f"⚠️ Could not update the build cache in '{_CACHE_DIR}': {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
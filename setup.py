@@ -6,6 +6,7 @@ setup(
     py_modules=["resume_builder"],
     install_requires=[
         "Jinja2",
+        "PyYAML",
     ],
     entry_points={
         "console_scripts": [